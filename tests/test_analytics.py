@@ -0,0 +1,140 @@
+import gzip
+import os
+import shutil
+from datetime import date, datetime
+from unittest import TestCase
+from zoneinfo import ZoneInfo
+
+from zlogger_kit.analytics import ZLogAnalytics, main
+from zlogger_kit.zlog import ZLog
+from zlogger_kit.models import ZLogConfig, ZNetworkResponse
+from zlogger_kit.enums import ZModule
+
+
+class TestZLogAnalytics(TestCase):
+    def setUp(self):
+        self.test_dir = "test_logs"
+        os.makedirs(self.test_dir, exist_ok=True)
+
+    def tearDown(self):
+        for file in os.listdir(self.test_dir):
+            os.remove(os.path.join(self.test_dir, file))
+        os.rmdir(self.test_dir)
+        ZLog._instances = {}
+
+    def _write_logs(self, module, json_format, day):
+        logger = ZLog.init(
+            ZLogConfig(module=module, log_path=self.test_dir, json_format=json_format)
+        )
+        logger.set_current_time(datetime(2024, 1, day, tzinfo=ZoneInfo("Asia/Riyadh")))
+        for status_code in (200, 200, 500):
+            logger.info('Payment "created"', amount=100)
+            logger.network_response(ZNetworkResponse(status_code=status_code))
+        logger.error("Payment failed")
+
+    def test_json_and_text_formats(self):
+        self._write_logs(ZModule.TEST_JSON_FORMAT, True, 1)
+        self._write_logs(ZModule.TEST_TEXT_FORMAT, False, 1)
+
+        report = ZLogAnalytics(self.test_dir, workers=1).run()
+
+        self.assertEqual(report.files, 2)
+        self.assertEqual(report.records, 14)
+        self.assertEqual(report.unparsed, 0)
+        self.assertEqual(report.levels, {"INFO": 12, "ERROR": 2})
+        self.assertEqual(report.priorities, {"P20": 12, "P40": 2})
+        self.assertEqual(report.status_codes, {200: 4, 500: 2})
+        self.assertEqual(report.top_messages[0], ('Payment "created"', 6))
+
+    def test_gzip_chunks_and_date_range(self):
+        self._write_logs(ZModule.TEST_JSON_FORMAT, True, 1)
+        self._write_logs(ZModule.TEST_JSON_FORMAT, True, 2)
+        self._write_logs(ZModule.OTHER, True, 2)
+        plain = os.path.join(self.test_dir, "test_json_format-2024-01-01.log")
+        with open(plain, "rb") as source, gzip.open(plain + ".gz", "wb") as target:
+            shutil.copyfileobj(source, target)
+        os.remove(plain)
+
+        analytics = ZLogAnalytics(
+            self.test_dir, module=ZModule.TEST_JSON_FORMAT, workers=2, chunk_size=256
+        )
+        report = analytics.run()
+        self.assertEqual(report.files, 2)
+        self.assertEqual(report.records, 14)
+        self.assertEqual(report.status_codes, {200: 4, 500: 2})
+
+        report = analytics.run(since=date(2024, 1, 2))
+        self.assertEqual(report.files, 1)
+        self.assertEqual(report.records, 7)
+
+    def test_text_message_containing_fields_prefix(self):
+        message = 'Payment é "q" {"level": "INFO"} {"level": x}'
+        for module, json_format in (
+            (ZModule.TEST_JSON_FORMAT, True),
+            (ZModule.TEST_TEXT_FORMAT, False),
+        ):
+            logger = ZLog.init(
+                ZLogConfig(
+                    module=module, log_path=self.test_dir, json_format=json_format
+                )
+            )
+            logger.info(message, extra={"level": "INFO", "nested": [1]})
+            logger.network_response(ZNetworkResponse(status_code=404))
+
+        report = ZLogAnalytics(self.test_dir, workers=1).run()
+
+        self.assertEqual(report.records, 4)
+        self.assertEqual(report.top_messages, [("404", 2), (message, 2)])
+        self.assertEqual(report.status_codes, {404: 2})
+
+    def test_deterministic_tie_order(self):
+        logger = ZLog.init(ZLogConfig(module=ZModule.OTHER, log_path=self.test_dir))
+        for day in (1, 2, 3):
+            logger.set_current_time(datetime(2024, 1, day, tzinfo=ZoneInfo("UTC")))
+            for index in range(20):
+                logger.info(f"msg {(index + day * 7) % 20}")
+
+        analytics = ZLogAnalytics(self.test_dir, workers=3, chunk_size=200, top=5)
+        reports = [analytics.run().top_messages for _ in range(3)]
+
+        self.assertEqual(reports[0], [(f"msg {i}", 3) for i in (0, 1, 10, 11, 12)])
+        self.assertTrue(all(report == reports[0] for report in reports))
+
+    def test_nested_status_code_not_counted(self):
+        payload = {"b": 1, "operation": "response", "status_code": 500}
+        for module, json_format in (
+            (ZModule.TEST_JSON_FORMAT, True),
+            (ZModule.TEST_TEXT_FORMAT, False),
+        ):
+            logger = ZLog.init(
+                ZLogConfig(
+                    module=module, log_path=self.test_dir, json_format=json_format
+                )
+            )
+            logger.info("cfg", payload=payload)
+            logger.network_response(ZNetworkResponse(status_code=200))
+
+        report = ZLogAnalytics(self.test_dir, workers=1).run()
+
+        self.assertEqual(report.records, 4)
+        self.assertEqual(report.status_codes, {200: 2})
+
+    def test_messages_approximate_over_capacity(self):
+        logger = ZLog.init(ZLogConfig(module=ZModule.OTHER, log_path=self.test_dir))
+        for index in range(20):
+            logger.info("Payment created")
+            logger.info(f"GET /payments/{index}")
+
+        report = ZLogAnalytics(self.test_dir, workers=1).run()
+        self.assertFalse(report.messages_approximate)
+        self.assertEqual(report.top_messages[0], ("Payment created", 20))
+
+        report = ZLogAnalytics(self.test_dir, workers=1, message_capacity=5).run()
+        self.assertTrue(report.messages_approximate)
+        self.assertEqual(report.top_messages[0][0], "Payment created")
+        self.assertLessEqual(report.top_messages[0][1], 20)
+
+    def test_cli_missing_log_directory(self):
+        with self.assertRaises(SystemExit) as context:
+            main([os.path.join(self.test_dir, "missing")])
+        self.assertEqual(context.exception.code, 2)
@@ -4,9 +4,12 @@ from datetime import datetime
 from unittest import TestCase
 from zoneinfo import ZoneInfo
 
+from pydantic import ValidationError
+
 from zlogger_kit.zlog import ZLog
 from zlogger_kit.models import ZLogConfig, ZNetworkRequest, ZNetworkResponse
 from zlogger_kit.enums import ZLogLevel, ZNetworkOperation, ZModule
+from zlogger_kit.serializer import TRUNCATED_MARKER
 
 
 class TestZLog(TestCase):
@@ -143,6 +146,211 @@ class TestZLog(TestCase):
         for component in expected_components:
             self.assertIn(component, log_line)
 
+    def _bounded_logger(self, json_format=True, **limits):
+        config = ZLogConfig(
+            module=ZModule.OTHER,
+            log_path=self.test_dir,
+            time_zone="Asia/Riyadh",
+            json_format=json_format,
+            **limits,
+        )
+        logger = ZLog.init(config)
+        logger.set_current_time(datetime(2024, 1, 1, tzinfo=ZoneInfo("Asia/Riyadh")))
+        return logger
+
+    def _read_lines(self, module):
+        log_file = os.path.join(self.test_dir, f"{module}-2024-01-01.log")
+        with open(log_file, "r") as f:
+            return f.readlines()
+
+    def test_bounded_field_truncation(self):
+        logger = self._bounded_logger(
+            max_string_length=5, max_collection_items=2, max_depth=1
+        )
+        logger.info(
+            "Bounded",
+            text="abcdefgh",
+            items=[1, 2, 3],
+            nested={"inner": {"deep": 1}},
+            body=b"\x00" * 1000,
+        )
+
+        log_data = json.loads(self._read_lines(ZModule.OTHER.value)[0])
+        self.assertEqual(log_data["text"], "abcde" + TRUNCATED_MARKER)
+        self.assertEqual(log_data["items"], [1, 2, TRUNCATED_MARKER])
+        self.assertEqual(log_data["nested"], {"inner": TRUNCATED_MARKER})
+        self.assertEqual(log_data["body"], "\x00" * 5 + TRUNCATED_MARKER)
+        self.assertEqual(log_data["message"], "Bound" + TRUNCATED_MARKER)
+
+    def test_bounded_line_bytes(self):
+        logger = self._bounded_logger(max_line_bytes=512)
+        logger.info("Large payload", payload=["x" * 100] * 1000, tail="y" * 10**6)
+
+        line = self._read_lines(ZModule.OTHER.value)[0]
+        self.assertLessEqual(len(line.encode("utf-8")), 512)
+        log_data = json.loads(line)
+        self.assertEqual(log_data["message"], "Large payload")
+        self.assertTrue(log_data["payload"][-1].endswith(TRUNCATED_MARKER))
+        self.assertNotIn("tail", log_data)
+        self.assertTrue(line.endswith('"\\u2026truncated": 1}\n'))
+
+    def test_bounded_line_bytes_keeps_structural_fields(self):
+        logger = self._bounded_logger(max_line_bytes=256, max_string_length=5)
+        logger.warn("Large payload " * 100, payload=["x" * 100] * 100)
+
+        line = self._read_lines(ZModule.OTHER.value)[0]
+        self.assertLessEqual(len(line.encode("utf-8")), 256)
+        log_data = json.loads(line)
+        self.assertEqual(log_data["timestamp"], "2024-01-01T00:00:00+03:00")
+        self.assertEqual(log_data["module"], ZModule.OTHER.value)
+        self.assertEqual(log_data["priority"], ZLogLevel.WARNING.priority)
+        self.assertEqual(log_data["level"], ZLogLevel.WARNING.value)
+        self.assertEqual(log_data["message"], "Large" + TRUNCATED_MARKER)
+
+    def test_bounded_large_nested_keys(self):
+        logger = self._bounded_logger(max_line_bytes=256)
+        logger.info("Large key", payload={"k" * 10**6: 1}, after=1)
+        ZLog._instances = {}
+        logger = self._bounded_logger(max_string_length=5)
+        logger.info("Large key", payload={"k" * 10**6: 1})
+
+        lines = self._read_lines(ZModule.OTHER.value)
+        self.assertLessEqual(len(lines[0].encode("utf-8")), 256)
+        log_data = json.loads(lines[0])
+        self.assertEqual(log_data["payload"], {TRUNCATED_MARKER: 1})
+        self.assertEqual(log_data[TRUNCATED_MARKER], 1)
+        log_data = json.loads(lines[1])
+        self.assertEqual(log_data["payload"], {"kkkkk" + TRUNCATED_MARKER: 1})
+
+    def test_bounded_line_bytes_text_format(self):
+        logger = self._bounded_logger(json_format=False, max_line_bytes=256)
+        logger.info("m" * 500, x="y" * 1000)
+
+        line = self._read_lines(ZModule.OTHER.value)[0]
+        self.assertLessEqual(len(line.encode("utf-8")), 256)
+        self.assertTrue(line.startswith("[INFO]:[P20] [2024-01-01T00:00:00+03:00] m"))
+        self.assertIn(TRUNCATED_MARKER + ' {"level": "INFO"', line)
+        self.assertTrue(line.endswith("}\n"))
+
+    def test_bounded_limits_validation(self):
+        for limits in (
+            {"max_string_length": -1},
+            {"max_collection_items": -1},
+            {"max_depth": -1},
+            {"max_line_bytes": 100},
+            {"metrics_interval": 60},
+            {"metrics": True, "metrics_interval": 0},
+            {"metrics": True, "metrics_interval": -1},
+        ):
+            with self.assertRaises(ValidationError):
+                ZLogConfig(module=ZModule.OTHER, **limits)
+
+    def test_bytes_logging_without_limits(self):
+        test_time = datetime(2024, 1, 1, tzinfo=ZoneInfo("Asia/Riyadh"))
+        self.logger.set_current_time(test_time)
+        self.logger.info("Bytes", body=b"\xffpayload")
+
+        log_data = json.loads(self._read_lines(ZModule.TEST_JSON_FORMAT.value)[0])
+        self.assertEqual(log_data["body"], "\ufffdpayload")
+
+    def test_metrics_disabled_by_default(self):
+        self.logger.info("Test message")
+        self.assertIsNone(self.logger.metrics_snapshot())
+
+    def test_metrics_snapshot_and_self_report(self):
+        logger = self._bounded_logger(metrics=True, metrics_interval=1e-9)
+        logger.info("First")
+        logger.error("Second")
+
+        lines = self._read_lines(ZModule.OTHER.value)
+        self.assertEqual(len(lines), 3)
+        report = json.loads(lines[2])
+        self.assertEqual(report["message"], "ZLog metrics")
+        self.assertEqual(report["metrics"]["records_emitted"], 2)
+
+        snapshot = logger.metrics_snapshot()
+        self.assertEqual(snapshot.records_emitted, 3)
+        self.assertEqual(snapshot.records_dropped, 0)
+        self.assertEqual(snapshot.flushes, 3)
+        self.assertEqual(sum(snapshot.flush_latency_ms.values()), 3)
+        self.assertEqual(
+            snapshot.bytes_written, sum(len(line.encode("utf-8")) for line in lines)
+        )
+        self.assertGreater(snapshot.serialize_seconds, 0)
+        self.assertGreater(snapshot.write_seconds, 0)
+
+    def test_profiling_hook(self):
+        stages = []
+
+        def hook(stage, duration):
+            stages.append(stage)
+
+        self.logger.add_profiling_hook(hook)
+        self.logger.info("Test message")
+        self.logger.remove_profiling_hook(hook)
+        self.logger.info("Test message")
+
+        self.assertEqual(stages, ["serialize", "write", "flush"])
+        self.assertIsNone(self.logger.metrics_snapshot())
+        self.assertFalse(self.logger._instrumented)
+
+    def test_profiling_hook_without_self_reports(self):
+        logger = self._bounded_logger()
+        logger.add_profiling_hook(lambda stage, duration: None)
+        logger.info("First")
+        logger.info("Second")
+
+        self.assertEqual(len(self._read_lines(ZModule.OTHER.value)), 2)
+        self.assertIsNone(logger.metrics_snapshot())
+
+    def test_metrics_self_report_errors(self):
+        logger = self._bounded_logger(metrics=True, metrics_interval=1e-9)
+        logger.info("First")
+        format_log = logger._format_log
+
+        def failing_format_log(message, kwargs):
+            if message == "ZLog metrics":
+                raise OSError("disk full")
+            return format_log(message, kwargs)
+
+        logger._format_log = failing_format_log
+        with self.assertWarns(RuntimeWarning):
+            logger.info("Second")
+
+        self.assertEqual(len(self._read_lines(ZModule.OTHER.value)), 2)
+        snapshot = logger.metrics_snapshot()
+        self.assertEqual(snapshot.records_emitted, 2)
+        self.assertEqual(snapshot.records_dropped, 1)
+
+    def test_profiling_hook_errors(self):
+        stages = []
+
+        def failing_hook(stage, duration):
+            raise ValueError("hook failed")
+
+        def hook(stage, duration):
+            stages.append(stage)
+
+        logger = self._bounded_logger(metrics=True)
+        logger.add_profiling_hook(failing_hook)
+        logger.add_profiling_hook(hook)
+        with self.assertWarns(RuntimeWarning):
+            logger.info("Written")
+        with self.assertWarns(RuntimeWarning), self.assertRaises(TypeError):
+            logger.info("Unserializable", value=object())
+
+        self.assertEqual(len(self._read_lines(ZModule.OTHER.value)), 1)
+        self.assertEqual(stages, ["serialize", "write", "flush", "dropped"])
+        snapshot = logger.metrics_snapshot()
+        self.assertEqual(snapshot.records_emitted, 1)
+        self.assertEqual(snapshot.records_dropped, 1)
+
+    def test_metrics_dropped_records(self):
+        logger = self._bounded_logger(metrics=True)
+        with self.assertRaises(TypeError):
+            logger.info("Unserializable", value=object())
+        self.assertEqual(logger.metrics_snapshot().records_dropped, 1)
+
     def _is_json(self, string):
         try:
             json.loads(string)
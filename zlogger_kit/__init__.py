@@ -1,8 +1,15 @@
 """ZLoggerKit - A structured logging utility for Python applications."""
 
 from zlogger_kit.zlog import ZLog
-from zlogger_kit.models import ZLogConfig, ZNetworkRequest, ZNetworkResponse
+from zlogger_kit.models import (
+    ZLogConfig,
+    ZLogMetricsSnapshot,
+    ZLogReport,
+    ZNetworkRequest,
+    ZNetworkResponse,
+)
 from zlogger_kit.middleware import ZLogMiddleware
+from zlogger_kit.analytics import ZLogAnalytics
 
 __all__ = [
     "ZLog",
@@ -10,4 +17,7 @@ __all__ = [
     "ZNetworkRequest",
     "ZNetworkResponse",
     "ZLogMiddleware",
+    "ZLogAnalytics",
+    "ZLogReport",
+    "ZLogMetricsSnapshot",
 ]
@@ -0,0 +1,415 @@
+"""Analytics module for aggregating statistics over archived log files.
+
+This module streams ``{module}-{date}.log`` files written by ZLog, including
+gzip-rotated ``.log.gz`` files, through a process pool and merges the partial
+aggregates computed by each worker into a single ZLogReport.
+"""
+
+import argparse
+import gzip
+import heapq
+import json
+import multiprocessing
+import os
+import re
+from collections import Counter
+from datetime import date
+from typing import Iterator
+
+from zlogger_kit.models import ZLogReport
+
+_FILE_PATTERN = re.compile(
+    r"^(?P<module>.+)-(?P<date>\d{4}-\d{2}-\d{2})\.log(?:\.\d+)?(?P<gzip>\.gz)?$"
+)
+
+_JSON_HEAD = re.compile(
+    rb'^\{"timestamp": "[^"]*", "module": "(?:[^"\\]|\\.)*", '
+    rb'"priority": "([^"]*)", "message": "((?:[^"\\]|\\.)*)"'
+    rb'(?:, "level": "([^"]*)")?'
+)
+
+_TEXT_HEAD = re.compile(rb"^\[([A-Z]+)\]:\[(P\d+)\] \[[^\]]*\] ")
+
+_TEXT_FIELDS = b' {"level": "'
+
+_STATUS_CODE = re.compile(rb', "operation": "response", "status_code": (\d+)[,}]')
+
+_DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+def _find_text_fields(rest: bytes, level: bytes) -> int:
+    """Find where the fields object of a text-format line starts.
+
+    The object is the end of the line and starts with the record's level.
+    The message before it and values nested inside it may contain the same
+    bytes, so when there are several candidates the rightmost one that
+    decodes as the whole remainder of the line is used.
+
+    Args:
+        rest (bytes): The line after the level, priority and timestamp.
+        level (bytes): The record's level.
+
+    Returns:
+        int: Offset of the space before the object, or -1 if there is none.
+    """
+    pattern = _TEXT_FIELDS + level + b'"'
+    start = rest.rfind(pattern)
+    if start < 0 or rest.find(pattern) == start:
+        return start
+    while start >= 0:
+        try:
+            json.loads(rest[start + 1 :])
+            return start
+        except ValueError:
+            start = rest.rfind(pattern, 0, start)
+    return -1
+
+
+class _Aggregate:
+    """Partial statistics computed by a worker and merged by the parent.
+
+    Keys are kept as the raw bytes found in the log lines so no decoding
+    happens per record. Message counters are pruned to a fixed capacity,
+    which keeps memory constant regardless of how many records are read.
+    """
+
+    __slots__ = (
+        "files",
+        "records",
+        "unparsed",
+        "levels",
+        "priorities",
+        "status_codes",
+        "json_messages",
+        "text_messages",
+        "approximate",
+    )
+
+    def __init__(self, files: int = 0):
+        """Initialize empty statistics.
+
+        Args:
+            files (int, optional): Number of files the statistics start.
+                Defaults to 0.
+        """
+        self.files = files
+        self.records = 0
+        self.unparsed = 0
+        self.levels = Counter()
+        self.priorities = Counter()
+        self.status_codes = Counter()
+        self.json_messages = Counter()
+        self.text_messages = Counter()
+        self.approximate = False
+
+    def add_line(self, line: bytes) -> None:
+        """Count one log line in either the JSON or the text format.
+
+        A status code is only counted when the record's top-level fields
+        right after its level are those written by ZLog.network_response.
+
+        Args:
+            line (bytes): The raw log line.
+        """
+        match = _JSON_HEAD.match(line)
+        if match is not None:
+            priority, message, level = match.groups()
+            self.json_messages[message] += 1
+            status_start = match.end() if level else -1
+        else:
+            match = _TEXT_HEAD.match(line)
+            if match is None:
+                if line.strip():
+                    self.unparsed += 1
+                return
+            level, priority = match.groups()
+            rest = line[match.end() :].rstrip(b"\r\n")
+            fields_start = _find_text_fields(rest, level)
+            message = rest[:fields_start] if fields_start >= 0 else rest[:-1]
+            self.text_messages[message] += 1
+            line = rest
+            status_start = (
+                fields_start + len(_TEXT_FIELDS) + len(level) + 1
+                if fields_start >= 0
+                else -1
+            )
+        self.records += 1
+        if level:
+            self.levels[level] += 1
+        if priority:
+            self.priorities[priority] += 1
+        if status_start >= 0:
+            status = _STATUS_CODE.match(line, status_start)
+            if status is not None:
+                self.status_codes[status.group(1)] += 1
+
+    def merge(self, other: "_Aggregate", capacity: int) -> None:
+        """Add the statistics of another aggregate to this one.
+
+        Args:
+            other (_Aggregate): The partial statistics to add.
+            capacity (int): Maximum distinct messages kept per counter.
+        """
+        self.files += other.files
+        self.records += other.records
+        self.unparsed += other.unparsed
+        self.levels.update(other.levels)
+        self.priorities.update(other.priorities)
+        self.status_codes.update(other.status_codes)
+        self.json_messages.update(other.json_messages)
+        self.text_messages.update(other.text_messages)
+        self.approximate = self.approximate or other.approximate
+        self.prune(capacity)
+
+    def prune(self, capacity: int) -> None:
+        """Reduce the message counters to at most capacity entries each.
+
+        Uses the Misra-Gries reduction: the count of the first entry past
+        capacity is subtracted from all entries and non-positive entries are
+        dropped. Frequent messages survive, with counts that are exact until
+        capacity is exceeded and lower bounds afterwards, which is recorded
+        in ``approximate``.
+
+        Args:
+            capacity (int): Maximum distinct messages kept per counter.
+        """
+        for counter in (self.json_messages, self.text_messages):
+            if len(counter) <= capacity:
+                continue
+            self.approximate = True
+            threshold = heapq.nlargest(capacity + 1, counter.values())[-1]
+            for message, count in list(counter.items()):
+                if count <= threshold:
+                    del counter[message]
+                else:
+                    counter[message] = count - threshold
+
+    def report(self, top: int) -> ZLogReport:
+        """Decode the statistics into a report.
+
+        Args:
+            top (int): Number of most frequent messages to report.
+
+        Returns:
+            ZLogReport: The decoded statistics.
+        """
+        messages = Counter()
+        for message, count in self.json_messages.items():
+            messages[json.loads(b'"' + message + b'"')] += count
+        for message, count in self.text_messages.items():
+            messages[message.decode("utf-8", errors="replace")] += count
+        return ZLogReport(
+            files=self.files,
+            records=self.records,
+            unparsed=self.unparsed,
+            levels=dict(_by_count({k.decode(): v for k, v in self.levels.items()})),
+            priorities={k.decode(): v for k, v in sorted(self.priorities.items())},
+            status_codes={int(k): v for k, v in sorted(self.status_codes.items())},
+            top_messages=_by_count(messages, top),
+            messages_approximate=self.approximate,
+        )
+
+
+def _by_count(counts: dict, top: int | None = None) -> list[tuple]:
+    """Order counted items by descending count, breaking ties by item.
+
+    Ties are broken by item rather than insertion order, so the result does
+    not depend on the order in which worker results were merged.
+
+    Args:
+        counts (dict): Counts by item.
+        top (int, optional): Number of items to return. Defaults to all.
+
+    Returns:
+        list[tuple]: The (item, count) pairs.
+    """
+    if top is None:
+        return sorted(counts.items(), key=_count_order)
+    return heapq.nsmallest(top, counts.items(), key=_count_order)
+
+
+def _count_order(item: tuple) -> tuple:
+    """Build the sort key of a counted item.
+
+    Args:
+        item (tuple): The (item, count) pair.
+
+    Returns:
+        tuple: The negated count followed by the item.
+    """
+    return -item[1], item[0]
+
+
+def _analyze_chunk(task: tuple[str, int, int | None, int]) -> _Aggregate:
+    """Compute the partial statistics for one file or byte range of a file.
+
+    A line belongs to the chunk in which it starts, so byte ranges may end
+    in the middle of a line without records being lost or counted twice.
+
+    Args:
+        task: The file path, start offset, end offset (None for the whole
+            file) and message capacity.
+
+    Returns:
+        _Aggregate: The partial statistics for the chunk.
+    """
+    path, start, end, capacity = task
+    aggregate = _Aggregate(files=1 if start == 0 else 0)
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as f:
+        position = start
+        if start > 0:
+            f.seek(start - 1)
+            position += len(f.readline()) - 1
+        for line in f:
+            if end is not None and position >= end:
+                break
+            position += len(line)
+            aggregate.add_line(line)
+            if len(aggregate.json_messages) + len(aggregate.text_messages) > (
+                4 * capacity
+            ):
+                aggregate.prune(capacity)
+    aggregate.prune(capacity)
+    return aggregate
+
+
+class ZLogAnalytics:
+    """Parallel streaming analytics over an archive of ZLog files.
+
+    Files are split into tasks of one file, or one byte range of a large
+    uncompressed file, and each task is processed by a worker of a process
+    pool. Partial aggregates are merged as soon as they complete, so memory
+    stays constant regardless of archive size.
+
+    Args:
+        log_path: Directory containing the log files.
+        module: Module whose files are analyzed, or None for all modules.
+        workers: Number of worker processes (default: CPU count).
+        chunk_size: Maximum bytes of an uncompressed file per task.
+        top: Number of most frequent messages to report.
+        message_capacity: Maximum distinct messages tracked per counter.
+    """
+
+    def __init__(
+        self,
+        log_path: str = "logs",
+        module: str | None = None,
+        workers: int | None = None,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+        top: int = 10,
+        message_capacity: int = 10000,
+    ):
+        """Initialize the analytics with an archive location and settings."""
+        self.log_path = log_path
+        self.module = module
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.top = top
+        self.message_capacity = message_capacity
+
+    def files(self, since: date | None = None, until: date | None = None) -> list:
+        """List the log files in the archive, optionally within a date range.
+
+        Args:
+            since (date, optional): First date to include. Defaults to None.
+            until (date, optional): Last date to include. Defaults to None.
+
+        Returns:
+            list: Sorted paths of the matching log files.
+        """
+        module = self.module.lower() if self.module is not None else None
+        paths = []
+        for name in os.listdir(self.log_path):
+            match = _FILE_PATTERN.match(name)
+            if match is None:
+                continue
+            if module is not None and match["module"] != module:
+                continue
+            if since is not None and match["date"] < since.isoformat():
+                continue
+            if until is not None and match["date"] > until.isoformat():
+                continue
+            paths.append(os.path.join(self.log_path, name))
+        return sorted(paths)
+
+    def _tasks(self, paths: list) -> Iterator[tuple[str, int, int | None, int]]:
+        """Split log files into worker tasks.
+
+        Args:
+            paths (list): Paths of the log files to analyze.
+
+        Yields:
+            tuple: The file path, start offset, end offset and message capacity.
+        """
+        for path in paths:
+            size = os.path.getsize(path)
+            if path.endswith(".gz") or size <= self.chunk_size:
+                yield path, 0, None, self.message_capacity
+                continue
+            for start in range(0, size, self.chunk_size):
+                yield path, start, start + self.chunk_size, self.message_capacity
+
+    def run(self, since: date | None = None, until: date | None = None) -> ZLogReport:
+        """Analyze the log files in the archive.
+
+        Args:
+            since (date, optional): First date to include. Defaults to None.
+            until (date, optional): Last date to include. Defaults to None.
+
+        Returns:
+            ZLogReport: Counts by level and priority, the status code
+            distribution of network responses and the most frequent messages.
+        """
+        tasks = self._tasks(self.files(since, until))
+        total = _Aggregate()
+        if self.workers == 1:
+            for task in tasks:
+                total.merge(_analyze_chunk(task), self.message_capacity)
+            return total.report(self.top)
+
+        with multiprocessing.Pool(self.workers) as pool:
+            for partial in pool.imap_unordered(_analyze_chunk, tasks):
+                total.merge(partial, self.message_capacity)
+        return total.report(self.top)
+
+
+def main(argv: list | None = None) -> None:
+    """Run log analytics from the command line and print a JSON report.
+
+    Args:
+        argv (list, optional): Command line arguments. Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(
+        prog="zlogger-analytics",
+        description="Aggregate statistics over an archive of ZLog files.",
+    )
+    parser.add_argument("log_path", nargs="?", default="logs")
+    parser.add_argument("--module", help="only analyze files of this module")
+    parser.add_argument("--since", type=date.fromisoformat, help="YYYY-MM-DD")
+    parser.add_argument("--until", type=date.fromisoformat, help="YYYY-MM-DD")
+    parser.add_argument("--workers", type=int, help="number of worker processes")
+    parser.add_argument("--top", type=int, default=10, help="messages to report")
+    parser.add_argument(
+        "--message-capacity",
+        type=int,
+        default=10000,
+        help="distinct messages tracked before counts become approximate",
+    )
+    args = parser.parse_args(argv)
+    if not os.path.isdir(args.log_path):
+        parser.error(f"log directory not found: {args.log_path}")
+
+    analytics = ZLogAnalytics(
+        log_path=args.log_path,
+        module=args.module,
+        workers=args.workers,
+        top=args.top,
+        message_capacity=args.message_capacity,
+    )
+    report = analytics.run(since=args.since, until=args.until)
+    print(report.model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Metrics module for ZLog self-instrumentation.
+
+This module provides the counters and latency histogram that ZLog updates on
+its write path when metrics are enabled, and the profiling hook type.
+"""
+
+from bisect import bisect_left
+from typing import Callable
+
+from zlogger_kit.models import ZLogMetricsSnapshot
+
+FLUSH_LATENCY_BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100)
+"""Upper bounds in milliseconds of the flush latency histogram buckets."""
+
+_FLUSH_LATENCY_BUCKETS_NS = tuple(
+    int(ms * 1_000_000) for ms in FLUSH_LATENCY_BUCKETS_MS
+)
+
+_FLUSH_LATENCY_LABELS = tuple(f"{ms:g}" for ms in FLUSH_LATENCY_BUCKETS_MS) + ("+Inf",)
+
+ZProfilingHook = Callable[[str, int], None]
+"""Callable receiving a _write_log stage name and its duration in nanoseconds."""
+
+
+class ZLogMetrics:
+    """Internal metrics of a single ZLog instance.
+
+    ZLog writes each record synchronously and does not filter records, so
+    ``filtered`` and ``queue_depth`` stay at zero; they are kept so snapshots
+    have the same shape as those of buffered or filtering loggers.
+
+    Args:
+        report_interval: Seconds between periodic self-report records, or None
+            to disable self-reports.
+    """
+
+    __slots__ = (
+        "emitted",
+        "dropped",
+        "filtered",
+        "bytes_written",
+        "flushes",
+        "flush_latency",
+        "serialize_ns",
+        "write_ns",
+        "queue_depth",
+        "_report_interval_ns",
+        "_next_report_ns",
+    )
+
+    def __init__(self, report_interval: float | None = None):
+        """Initialize all counters to zero."""
+        self.emitted = 0
+        self.dropped = 0
+        self.filtered = 0
+        self.bytes_written = 0
+        self.flushes = 0
+        self.flush_latency = [0] * len(_FLUSH_LATENCY_LABELS)
+        self.serialize_ns = 0
+        self.write_ns = 0
+        self.queue_depth = 0
+        self._report_interval_ns = (
+            int(report_interval * 1_000_000_000)
+            if report_interval is not None
+            else None
+        )
+        self._next_report_ns = None
+
+    def record(
+        self, size: int, serialize_ns: int, write_ns: int, flush_ns: int
+    ) -> None:
+        """Record a successfully written log record.
+
+        Args:
+            size (int): Bytes written for the record.
+            serialize_ns (int): Nanoseconds spent building and serializing it.
+            write_ns (int): Nanoseconds spent writing it, including the flush.
+            flush_ns (int): Nanoseconds spent flushing it to the file.
+        """
+        self.emitted += 1
+        self.bytes_written += size
+        self.flushes += 1
+        self.flush_latency[bisect_left(_FLUSH_LATENCY_BUCKETS_NS, flush_ns)] += 1
+        self.serialize_ns += serialize_ns
+        self.write_ns += write_ns
+
+    def report_due(self, now_ns: int) -> bool:
+        """Check whether a periodic self-report record should be written.
+
+        The first call, and the first call after a report is due, only
+        start the interval, so writing the report record never triggers
+        another report.
+
+        Args:
+            now_ns (int): Current monotonic time in nanoseconds.
+
+        Returns:
+            bool: True if the report interval has elapsed.
+        """
+        if self._report_interval_ns is None:
+            return False
+        if self._next_report_ns is None:
+            self._next_report_ns = now_ns + self._report_interval_ns
+            return False
+        if now_ns < self._next_report_ns:
+            return False
+        self._next_report_ns = None
+        return True
+
+    def snapshot(self) -> ZLogMetricsSnapshot:
+        """Take a point-in-time copy of the metrics.
+
+        Returns:
+            ZLogMetricsSnapshot: The current values of all metrics.
+        """
+        return ZLogMetricsSnapshot(
+            records_emitted=self.emitted,
+            records_dropped=self.dropped,
+            records_filtered=self.filtered,
+            bytes_written=self.bytes_written,
+            flushes=self.flushes,
+            flush_latency_ms=dict(zip(_FLUSH_LATENCY_LABELS, self.flush_latency)),
+            serialize_seconds=self.serialize_ns / 1_000_000_000,
+            write_seconds=self.write_ns / 1_000_000_000,
+            queue_depth=self.queue_depth,
+        )
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 
 
 class ZLogConfig(BaseModel):
@@ -9,12 +9,44 @@ class ZLogConfig(BaseModel):
         time_zone: Timezone for log timestamps (default: "Asia/Riyadh")
         json_format: Whether to output logs in JSON format (default: True)
         log_path: Directory path for log files (default: "logs")
+        max_string_length: Maximum characters kept from a string or bytes
+            field value (default: None, unlimited)
+        max_collection_items: Maximum items kept from a list, tuple or dict
+            field value (default: None, unlimited)
+        max_depth: Maximum nesting depth of containers inside a field value
+            (default: None, unlimited)
+        max_line_bytes: Maximum size in bytes of a whole log line, at least
+            256 (default: None, unlimited)
+        metrics: Whether to collect internal logging metrics (default: False)
+        metrics_interval: Seconds between periodic metrics self-report
+            records, must be positive and requires metrics (default: None,
+            disabled)
     """
 
     module: str
     time_zone: str = "Asia/Riyadh"
     json_format: bool = True
     log_path: str = "logs"
+    max_string_length: int | None = Field(default=None, ge=0)
+    max_collection_items: int | None = Field(default=None, ge=0)
+    max_depth: int | None = Field(default=None, ge=0)
+    max_line_bytes: int | None = Field(default=None, ge=256)
+    metrics: bool = False
+    metrics_interval: float | None = Field(default=None, gt=0)
+
+    @model_validator(mode="after")
+    def _check_metrics_interval(self) -> "ZLogConfig":
+        """Reject a self-report interval when metrics are disabled.
+
+        Returns:
+            ZLogConfig: The validated configuration.
+
+        Raises:
+            ValueError: If metrics_interval is set without metrics.
+        """
+        if self.metrics_interval is not None and not self.metrics:
+            raise ValueError("metrics_interval requires metrics=True")
+        return self
 
 
 class ZNetworkRequest(BaseModel):
@@ -45,3 +77,56 @@ class ZNetworkResponse(BaseModel):
     status_code: int
     headers: dict | None = None
     body: object | None = None
+
+
+class ZLogReport(BaseModel):
+    """Model representing aggregated statistics over archived log files.
+
+    Attributes:
+        files: Number of log files analyzed
+        records: Number of log records parsed
+        unparsed: Number of non-empty lines that could not be parsed
+        levels: Record counts by log level
+        priorities: Record counts by priority
+        status_codes: Network response counts by HTTP status code
+        top_messages: Most frequent messages with their counts. Once more
+            distinct messages than the message capacity are seen, counts are
+            lower bounds and fewer than the requested messages may be listed
+        messages_approximate: Whether the message capacity was exceeded, so
+            top_messages is approximate
+    """
+
+    files: int = 0
+    records: int = 0
+    unparsed: int = 0
+    levels: dict[str, int] = {}
+    priorities: dict[str, int] = {}
+    status_codes: dict[int, int] = {}
+    top_messages: list[tuple[str, int]] = []
+    messages_approximate: bool = False
+
+
+class ZLogMetricsSnapshot(BaseModel):
+    """Model representing a point-in-time copy of a ZLog instance's metrics.
+
+    Attributes:
+        records_emitted: Number of records written
+        records_dropped: Number of records that failed to serialize or write
+        records_filtered: Number of records filtered out before writing
+        bytes_written: Number of bytes written
+        flushes: Number of flushes to the log file
+        flush_latency_ms: Flush counts by latency bucket upper bound in ms
+        serialize_seconds: Total time spent building and serializing records
+        write_seconds: Total time spent writing records, including flushes
+        queue_depth: Number of records waiting to be written
+    """
+
+    records_emitted: int = 0
+    records_dropped: int = 0
+    records_filtered: int = 0
+    bytes_written: int = 0
+    flushes: int = 0
+    flush_latency_ms: dict[str, int] = {}
+    serialize_seconds: float = 0.0
+    write_seconds: float = 0.0
+    queue_depth: int = 0
@@ -0,0 +1,531 @@
+"""Serializer module for size-bounded JSON encoding of log entries.
+
+This module provides a JSON encoder that enforces the limits configured on
+ZLogConfig while it serializes, so oversized payloads are never fully encoded.
+"""
+
+import json
+from typing import Any
+
+from zlogger_kit.models import ZLogConfig
+
+TRUNCATED_MARKER = "…truncated"
+"""Marker appended to or inserted in place of truncated log data."""
+
+STRUCTURAL_FIELDS = frozenset(("timestamp", "module", "priority", "level"))
+"""Top-level fields of a log entry that are never truncated or dropped."""
+
+_ENCODED_MARKER = json.dumps(TRUNCATED_MARKER)
+
+_MARKER_BYTES = TRUNCATED_MARKER.encode("utf-8")
+
+_LIST_MARKER_SIZE = len(f", {_ENCODED_MARKER}")
+
+
+def encode_default(obj: Any) -> str:
+    """Encode values that json.dumps does not support natively.
+
+    Bytes values are decoded as UTF-8, replacing invalid sequences.
+
+    Args:
+        obj (Any): The value json.dumps could not encode.
+
+    Returns:
+        str: The decoded value.
+
+    Raises:
+        TypeError: If the value is not a bytes-like object.
+    """
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return bytes(obj).decode("utf-8", errors="replace")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dict_marker_size(total: int) -> int:
+    """Compute the size of the marker that cuts a dict.
+
+    Args:
+        total (int): Number of items in the dict, bounding the omitted count.
+
+    Returns:
+        int: Bytes of the separator, marker key and omitted count.
+    """
+    return len(f", {_ENCODED_MARKER}: {total}")
+
+
+class ZLogSerializer:
+    """JSON serializer that bounds the size of log entries while encoding them.
+
+    Strings longer than ``max_string_length`` are cut, containers with more
+    than ``max_collection_items`` items are cut, containers nested deeper than
+    ``max_depth`` are replaced, and encoding stops once ``max_line_bytes`` is
+    reached. Every cut is marked with TRUNCATED_MARKER. Bytes values are
+    previewed by decoding only the leading ``max_string_length`` bytes.
+
+    The fields in STRUCTURAL_FIELDS are always written in full; the limits
+    apply to the message and the additional fields only. Entries that are
+    within the limits are encoded with ``json.dumps`` directly.
+
+    Output is ASCII-only (as with ``json.dumps`` defaults), so its length in
+    characters equals its length in bytes.
+
+    Args:
+        max_string_length: Maximum characters kept from a string or bytes value.
+        max_collection_items: Maximum items kept from a list, tuple or dict.
+        max_depth: Maximum nesting depth of containers inside a log field.
+        max_line_bytes: Maximum size of a whole log line, including the newline.
+    """
+
+    def __init__(
+        self,
+        max_string_length: int | None = None,
+        max_collection_items: int | None = None,
+        max_depth: int | None = None,
+        max_line_bytes: int | None = None,
+    ):
+        """Initialize the serializer with its limits."""
+        self.max_string_length = max_string_length
+        self.max_collection_items = max_collection_items
+        self.max_depth = max_depth
+        self.max_line_bytes = max_line_bytes
+
+    @classmethod
+    def from_config(cls, config: ZLogConfig) -> "ZLogSerializer | None":
+        """Create a serializer from the limits set on a logging configuration.
+
+        Args:
+            config (ZLogConfig): Configuration object containing logging settings.
+
+        Returns:
+            ZLogSerializer | None: A serializer, or None if no limit is set.
+        """
+        limits = (
+            config.max_string_length,
+            config.max_collection_items,
+            config.max_depth,
+            config.max_line_bytes,
+        )
+        if all(limit is None for limit in limits):
+            return None
+        return cls(*limits)
+
+    def truncate_string(self, value: str) -> str:
+        """Cut a string to the configured maximum length.
+
+        Args:
+            value (str): The string to cut.
+
+        Returns:
+            str: The string, suffixed with TRUNCATED_MARKER if it was cut.
+        """
+        limit = self.max_string_length
+        if limit is not None and len(value) > limit:
+            return value[:limit] + TRUNCATED_MARKER
+        return value
+
+    def fit_bytes(self, value: str, budget: int) -> str:
+        """Cut a string so that its UTF-8 encoding fits within a byte budget.
+
+        Only the leading ``budget`` characters are encoded to measure it.
+
+        Args:
+            value (str): The string to cut.
+            budget (int): Maximum size in bytes of the result.
+
+        Returns:
+            str: The string, suffixed with TRUNCATED_MARKER if it was cut.
+        """
+        head = value[: budget + 1].encode("utf-8")
+        if len(value) <= budget and len(head) <= budget:
+            return value
+        keep = head[: max(budget - len(_MARKER_BYTES), 0)]
+        return keep.decode("utf-8", errors="ignore") + TRUNCATED_MARKER
+
+    def structural_size(self, entry: dict) -> int:
+        """Compute the bytes an entry needs even when all other fields are cut.
+
+        Args:
+            entry (dict): Top-level fields of the log entry.
+
+        Returns:
+            int: Size of the braces, structural fields and truncation marker.
+        """
+        size = 2
+        for key, value in entry.items():
+            if key in STRUCTURAL_FIELDS:
+                size += len(f", {json.dumps(key)}: {json.dumps(value)}")
+        if len(entry) > len(STRUCTURAL_FIELDS.intersection(entry)):
+            size += _dict_marker_size(len(entry))
+        return size
+
+    def dumps(self, entry: dict, reserved_bytes: int = 0) -> str:
+        """Serialize a log entry to a bounded JSON object string.
+
+        Args:
+            entry (dict): Top-level fields of the log entry.
+            reserved_bytes (int, optional): Bytes of the line already used
+                outside of the encoded object. Defaults to 0.
+
+        Returns:
+            str: The JSON encoded entry.
+        """
+        budget = None
+        if self.max_line_bytes is not None:
+            budget = max(self.max_line_bytes - reserved_bytes, 0)
+
+        encoded = self._dumps_within_limits(entry, budget)
+        if encoded is not None:
+            return encoded
+        return _BoundedEncoder(self, budget).encode_entry(entry)
+
+    def _dumps_within_limits(self, entry: dict, budget: int | None) -> str | None:
+        """Encode an entry with json.dumps if no limit can apply to it.
+
+        Args:
+            entry (dict): Top-level fields of the log entry.
+            budget (int | None): Bytes available for the encoded entry.
+
+        Returns:
+            str | None: The JSON encoded entry, or None if it needs bounding.
+        """
+        max_length = self.max_string_length
+        characters = 0
+        for key, value in entry.items():
+            characters += len(key)
+            if isinstance(value, str):
+                if max_length is not None and len(value) > max_length:
+                    return None
+                characters += len(value)
+            elif not (value is None or isinstance(value, (bool, int, float))):
+                return None
+        if budget is None:
+            return json.dumps(entry)
+        if characters > budget:
+            return None
+        encoded = json.dumps(entry)
+        return encoded if len(encoded) <= budget else None
+
+
+class _BoundedEncoder:
+    """Single-use encoder state for one ZLogSerializer.dumps call.
+
+    The line budget is tracked in ``_remaining``. Bytes that must always be
+    written are held back from the room available to values:
+
+    - one byte per open container, for its closing bracket (``_open``);
+    - the truncation marker of the top-level entry (``_entry_reserve``),
+      which reports how many fields were omitted;
+    - inside a nested container, additionally the marker of that container,
+      so it can always mark where it was cut (``_reserve`` holds the total).
+
+    Only the innermost container marks a cut; once encoding is exhausted
+    the outer nested containers are closed without markers and only the
+    top-level entry reports its omitted fields.
+
+    Args:
+        serializer: The serializer whose limits are applied.
+        budget: Bytes available for the encoded entry, or None if unlimited.
+    """
+
+    def __init__(self, serializer: ZLogSerializer, budget: int | None):
+        """Initialize the encoder state with the full budget available."""
+        self._serializer = serializer
+        self._remaining = budget
+        self._parts = []
+        self._open = 0
+        self._reserve = 0
+        self._entry_reserve = 0
+        self._exhausted = False
+
+    def encode_entry(self, entry: dict) -> str:
+        """Encode the top-level fields of a log entry.
+
+        Structural fields are charged against the budget before anything
+        else and always written in full. The message is always written,
+        reduced to the truncation marker if nothing else fits. Field names
+        are never cut; fields whose name does not fit are omitted.
+
+        Args:
+            entry (dict): Top-level fields of the log entry.
+
+        Returns:
+            str: The JSON encoded entry.
+        """
+        structural = {}
+        for key, value in entry.items():
+            if key in STRUCTURAL_FIELDS:
+                structural[key] = json.dumps(value, default=encode_default)
+                self._charge(len(f", {json.dumps(key)}: {structural[key]}"))
+
+        self._emit("{")
+        self._open += 1
+        self._entry_reserve = _dict_marker_size(len(entry))
+        self._reserve = self._entry_reserve
+        separator = ""
+        omitted = 0
+        for key, value in entry.items():
+            if key in structural:
+                self._parts.append(f"{separator}{json.dumps(key)}: {structural[key]}")
+            elif self._exhausted:
+                omitted += 1
+                continue
+            else:
+                item_prefix = self._item_prefix(separator, key)
+                if item_prefix is None or not self._encode(value, 1, item_prefix):
+                    self._exhausted = True
+                    if key != "message":
+                        omitted += 1
+                        continue
+                    self._emit(f"{separator}{json.dumps(key)}: {_ENCODED_MARKER}")
+            separator = ", "
+        if omitted:
+            self._emit(f"{separator}{_ENCODED_MARKER}: {omitted}")
+        self._open -= 1
+        self._emit("}")
+        return "".join(self._parts)
+
+    def _room(self) -> float:
+        """Get the bytes still available to values.
+
+        Returns:
+            float: Remaining budget minus closing brackets and reserved
+            marker bytes, or infinity if the budget is unlimited.
+        """
+        if self._remaining is None:
+            return float("inf")
+        return self._remaining - self._open - self._reserve
+
+    def _charge(self, size: int) -> None:
+        """Subtract bytes from the remaining budget.
+
+        Args:
+            size (int): Number of bytes used.
+        """
+        if self._remaining is not None:
+            self._remaining -= size
+
+    def _emit(self, piece: str) -> None:
+        """Append an encoded piece and charge it against the budget.
+
+        Args:
+            piece (str): The encoded piece.
+        """
+        self._parts.append(piece)
+        self._charge(len(piece))
+
+    def _emit_marker(self, piece: str) -> None:
+        """Append a collection limit marker, stopping if it used the reserve.
+
+        Args:
+            piece (str): The encoded marker, including its separator.
+        """
+        self._emit(piece)
+        if self._room() < 0:
+            self._exhausted = True
+
+    def _item_prefix(self, separator: str, name: str) -> str | None:
+        """Encode the separator and key preceding a dict value.
+
+        The key is checked against the room before it is encoded, so keys
+        that cannot fit are never encoded.
+
+        Args:
+            separator (str): The separator written before the key.
+            name (str): The dict key.
+
+        Returns:
+            str | None: The encoded prefix, or None if the key does not fit.
+        """
+        if len(separator) + len(name) + 4 > self._room():
+            return None
+        return f"{separator}{json.dumps(name)}: "
+
+    def _encode(self, obj: Any, depth: int, prefix: str) -> bool:
+        """Encode a value preceded by prefix.
+
+        Args:
+            obj (Any): The value to encode.
+            depth (int): Nesting depth of the value.
+            prefix (str): Separator and key written before the value.
+
+        Returns:
+            bool: True if the value was written, False if nothing fit.
+
+        Raises:
+            TypeError: If the value is not JSON serializable.
+        """
+        if isinstance(obj, str):
+            return self._encode_str(self._serializer.truncate_string(obj), prefix)
+        if isinstance(obj, (bytes, bytearray, memoryview)):
+            return self._encode_str(self._preview_bytes(obj), prefix)
+        if obj is None or isinstance(obj, (bool, int, float)):
+            return self._encode_leaf(json.dumps(obj), prefix)
+        if isinstance(obj, (dict, list, tuple)):
+            max_depth = self._serializer.max_depth
+            if max_depth is not None and depth > max_depth:
+                return self._encode_str(TRUNCATED_MARKER, prefix)
+            if isinstance(obj, dict):
+                return self._encode_dict(obj, depth, prefix)
+            return self._encode_list(obj, depth, prefix)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def _preview_bytes(self, value: bytes | bytearray | memoryview) -> str:
+        """Decode the leading bytes of a bytes-like value that can be written.
+
+        Args:
+            value (bytes | bytearray | memoryview): The value to preview.
+
+        Returns:
+            str: The decoded preview, suffixed with TRUNCATED_MARKER if cut.
+        """
+        limit = self._serializer.max_string_length
+        if self._remaining is not None:
+            room = max(int(self._room()), 0)
+            limit = room if limit is None else min(limit, room)
+        if limit is None or len(value) <= limit:
+            return bytes(value).decode("utf-8", errors="replace")
+        preview = bytes(value[:limit]).decode("utf-8", errors="replace")
+        return preview + TRUNCATED_MARKER
+
+    def _encode_leaf(self, encoded: str, prefix: str) -> bool:
+        """Write an encoded scalar if it fits in the room.
+
+        Args:
+            encoded (str): The encoded value.
+            prefix (str): Separator and key written before the value.
+
+        Returns:
+            bool: True if the value was written.
+        """
+        piece = prefix + encoded
+        if len(piece) > self._room():
+            return False
+        self._emit(piece)
+        return True
+
+    def _encode_str(self, value: str, prefix: str) -> bool:
+        """Write a string, cutting it to the room if it does not fit.
+
+        Only the part of the string that can fit is encoded. Cutting a
+        string uses up the budget, so encoding stops after it.
+
+        Args:
+            value (str): The string to write.
+            prefix (str): Separator and key written before the value.
+
+        Returns:
+            bool: True if the string or a cut of it was written.
+        """
+        available = self._room() - len(prefix)
+        if len(value) + 2 <= available and self._encode_leaf(json.dumps(value), prefix):
+            return True
+        cut = int(available) - len(_ENCODED_MARKER)
+        while cut > 0:
+            encoded = json.dumps(value[:cut] + TRUNCATED_MARKER)
+            excess = len(encoded) - available
+            if excess <= 0:
+                self._emit(prefix + encoded)
+                self._exhausted = True
+                return True
+            cut -= excess
+        return False
+
+    def _encode_dict(self, obj: dict, depth: int, prefix: str) -> bool:
+        """Write a nested dict, cutting it at the item limit or the budget.
+
+        The dict is only opened if its brackets and its own marker fit. Its
+        keys are cut to ``max_string_length`` like string values.
+
+        Args:
+            obj (dict): The dict to write.
+            depth (int): Nesting depth of the dict.
+            prefix (str): Separator and key written before the dict.
+
+        Returns:
+            bool: True if the dict was opened and written.
+        """
+        total = len(obj)
+        marker_size = _dict_marker_size(total)
+        if len(prefix) + 1 + marker_size > self._room():
+            return False
+        self._emit(prefix + "{")
+        self._open += 1
+        outer_reserve = self._reserve
+        self._reserve = self._entry_reserve + marker_size
+        max_items = self._serializer.max_collection_items
+        separator = ""
+        for index, (key, value) in enumerate(obj.items()):
+            if self._exhausted:
+                break
+            if max_items is not None and index >= max_items:
+                self._emit_marker(f"{separator}{_ENCODED_MARKER}: {total - index}")
+                break
+            name = self._serializer.truncate_string(self._key(key))
+            item_prefix = self._item_prefix(separator, name)
+            if item_prefix is None or not self._encode(value, depth + 1, item_prefix):
+                self._emit(f"{separator}{_ENCODED_MARKER}: {total - index}")
+                self._exhausted = True
+                break
+            separator = ", "
+        self._reserve = outer_reserve
+        self._open -= 1
+        self._emit("}")
+        return True
+
+    def _encode_list(self, obj: list | tuple, depth: int, prefix: str) -> bool:
+        """Write a list or tuple, cutting it at the item limit or the budget.
+
+        The list is only opened if its brackets and its own marker fit.
+
+        Args:
+            obj (list | tuple): The list to write.
+            depth (int): Nesting depth of the list.
+            prefix (str): Separator and key written before the list.
+
+        Returns:
+            bool: True if the list was opened and written.
+        """
+        if len(prefix) + 1 + _LIST_MARKER_SIZE > self._room():
+            return False
+        self._emit(prefix + "[")
+        self._open += 1
+        outer_reserve = self._reserve
+        self._reserve = self._entry_reserve + _LIST_MARKER_SIZE
+        max_items = self._serializer.max_collection_items
+        separator = ""
+        for index, value in enumerate(obj):
+            if self._exhausted:
+                break
+            if max_items is not None and index >= max_items:
+                self._emit_marker(f"{separator}{_ENCODED_MARKER}")
+                break
+            if not self._encode(value, depth + 1, separator):
+                self._emit(f"{separator}{_ENCODED_MARKER}")
+                self._exhausted = True
+                break
+            separator = ", "
+        self._reserve = outer_reserve
+        self._open -= 1
+        self._emit("]")
+        return True
+
+    @staticmethod
+    def _key(key: Any) -> str:
+        """Convert a dict key to a string the way json.dumps does.
+
+        Args:
+            key (Any): The dict key.
+
+        Returns:
+            str: The key as a string.
+
+        Raises:
+            TypeError: If the key type is not supported by JSON.
+        """
+        if isinstance(key, str):
+            return key
+        if key is None or isinstance(key, (bool, int, float)):
+            return json.dumps(key)
+        raise TypeError(
+            f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+        )
@@ -1,10 +1,19 @@
 import os
 import json
+import warnings
 from datetime import datetime
+from time import perf_counter_ns
 from zoneinfo import ZoneInfo
 import structlog
-from zlogger_kit.models import ZLogConfig, ZNetworkRequest, ZNetworkResponse
+from zlogger_kit.models import (
+    ZLogConfig,
+    ZLogMetricsSnapshot,
+    ZNetworkRequest,
+    ZNetworkResponse,
+)
 from zlogger_kit.enums import ZLogLevel, ZNetworkOperation
+from zlogger_kit.metrics import ZLogMetrics, ZProfilingHook
+from zlogger_kit.serializer import ZLogSerializer, encode_default
 
 
 class ZLog:
@@ -29,6 +38,10 @@ class ZLog:
         os.makedirs(self._config.log_path, exist_ok=True)
         self._logger = self._create_logger()
         self._current_time = None
+        self._serializer = ZLogSerializer.from_config(config)
+        self._metrics = ZLogMetrics(config.metrics_interval) if config.metrics else None
+        self._hooks: list[ZProfilingHook] = []
+        self._instrumented = self._metrics is not None
 
     @property
     def config(self) -> ZLogConfig:
@@ -39,6 +52,42 @@ class ZLog:
         """
         return self._config
 
+    def metrics_snapshot(self) -> ZLogMetricsSnapshot | None:
+        """Get a point-in-time copy of the internal logging metrics.
+
+        Returns:
+            ZLogMetricsSnapshot | None: The current metrics, or None if
+            metrics are disabled.
+        """
+        if self._metrics is None:
+            return None
+        return self._metrics.snapshot()
+
+    def add_profiling_hook(self, hook: ZProfilingHook) -> None:
+        """Attach a hook called at the end of each _write_log stage.
+
+        The hook receives the stage name and its duration in nanoseconds. The
+        stages are "serialize", "write" and "flush"; if a record fails, the
+        hook receives "dropped" with the time spent on the record instead.
+        Exceptions raised by a hook are turned into warnings so that they
+        never interrupt logging. Hooks do not enable metrics.
+
+        Args:
+            hook (ZProfilingHook): The hook to attach.
+        """
+        self._hooks.append(hook)
+        self._instrumented = True
+
+    def remove_profiling_hook(self, hook: ZProfilingHook) -> None:
+        """Detach a hook previously attached with add_profiling_hook.
+
+        Args:
+            hook (ZProfilingHook): The hook to detach.
+        """
+        if hook in self._hooks:
+            self._hooks.remove(hook)
+        self._instrumented = self._metrics is not None or bool(self._hooks)
+
     @classmethod
     def init(cls, config: ZLogConfig) -> "ZLog":
         """Initialize or retrieve a ZLog instance for a specific module.
@@ -109,8 +158,105 @@ class ZLog:
             message (str): The log message to write.
             **kwargs: Additional fields to include in the log entry.
         """
+        if self._instrumented:
+            self._write_log_instrumented(message, kwargs)
+            return
+
         log_file = self._get_log_file_path()
+        log_content = self._format_log(message, kwargs)
+
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(log_content)
+
+    def _write_log_instrumented(self, message: str, kwargs: dict) -> None:
+        """Write a log entry while timing each stage for metrics and hooks.
+
+        Time spent in hooks is excluded from the stage durations. A failed
+        self-report is turned into a warning instead of being raised.
+
+        Args:
+            message (str): The log message to write.
+            kwargs (dict): Additional fields to include in the log entry.
+        """
+        metrics = self._metrics
+        start = perf_counter_ns()
+        try:
+            log_file = self._get_log_file_path()
+            log_content = self._format_log(message, kwargs)
+            serialize_ns = perf_counter_ns() - start
+            self._run_hooks("serialize", serialize_ns)
+
+            write_start = perf_counter_ns()
+            with open(log_file, "a", encoding="utf-8") as f:
+                f.write(log_content)
+                write_ns = perf_counter_ns() - write_start
+                self._run_hooks("write", write_ns)
+
+                flush_start = perf_counter_ns()
+                f.flush()
+                flushed = perf_counter_ns()
+            flush_ns = flushed - flush_start
+            self._run_hooks("flush", flush_ns)
+        except Exception:
+            if metrics is not None:
+                metrics.dropped += 1
+            self._run_hooks("dropped", perf_counter_ns() - start)
+            raise
+
+        if metrics is None:
+            return
+        size = (
+            len(log_content)
+            if log_content.isascii()
+            else len(log_content.encode("utf-8"))
+        )
+        metrics.record(size, serialize_ns, write_ns + flush_ns, flush_ns)
+        if metrics.report_due(flushed):
+            self._write_self_report(metrics)
+
+    def _write_self_report(self, metrics: ZLogMetrics) -> None:
+        """Write a periodic metrics self-report record.
+
+        The caller's record has already been written, so exceptions raised
+        while writing the report are turned into warnings.
+
+        Args:
+            metrics (ZLogMetrics): The metrics to report.
+        """
+        try:
+            self._write_log(
+                "ZLog metrics",
+                level=ZLogLevel.INFO.value,
+                metrics=metrics.snapshot().model_dump(),
+            )
+        except Exception as error:
+            warnings.warn(f"ZLog metrics self-report failed: {error!r}", RuntimeWarning)
+
+    def _run_hooks(self, stage: str, duration_ns: int) -> None:
+        """Call the profiling hooks for a _write_log stage.
+
+        Args:
+            stage (str): The stage name.
+            duration_ns (int): The stage duration in nanoseconds.
+        """
+        for hook in self._hooks:
+            try:
+                hook(stage, duration_ns)
+            except Exception as error:
+                warnings.warn(
+                    f"ZLog profiling hook {hook!r} failed: {error!r}", RuntimeWarning
+                )
+
+    def _format_log(self, message: str, kwargs: dict) -> str:
+        """Build and serialize a log entry.
 
+        Args:
+            message (str): The log message to write.
+            kwargs (dict): Additional fields to include in the log entry.
+
+        Returns:
+            str: The log line, including the trailing newline.
+        """
         level = kwargs.get("level", "")
         priority = ""
         try:
@@ -128,14 +274,42 @@ class ZLog:
             **kwargs,
         }
 
-        log_content = (
-            json.dumps(log_entry) + "\n"
+        if self._serializer is not None:
+            return self._serialize_bounded(log_entry, level_prefix, kwargs)
+        return (
+            json.dumps(log_entry, default=encode_default) + "\n"
             if self._config.json_format
-            else f"{level_prefix} [{log_entry['timestamp']}] {message} {json.dumps(kwargs) if kwargs else ''}\n"
+            else f"{level_prefix} [{log_entry['timestamp']}] {message} {json.dumps(kwargs, default=encode_default) if kwargs else ''}\n"
         )
 
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(log_content)
+    def _serialize_bounded(
+        self, log_entry: dict, level_prefix: str, kwargs: dict
+    ) -> str:
+        """Serialize a log entry within the size limits set on the configuration.
+
+        Args:
+            log_entry (dict): The full log entry used for the JSON format.
+            level_prefix (str): The level prefix used for the text format.
+            kwargs (dict): The additional fields used for the text format.
+
+        Returns:
+            str: The log line, including the trailing newline.
+        """
+        if self._config.json_format:
+            return self._serializer.dumps(log_entry, reserved_bytes=1) + "\n"
+
+        prefix = f"{level_prefix} [{log_entry['timestamp']}] "
+        message = self._serializer.truncate_string(log_entry["message"])
+        max_line_bytes = self._config.max_line_bytes
+        if max_line_bytes is not None:
+            fields_size = self._serializer.structural_size(kwargs) + 1 if kwargs else 0
+            budget = max_line_bytes - len(prefix.encode("utf-8")) - fields_size - 2
+            message = self._serializer.fit_bytes(message, max(budget, 0))
+        head = f"{prefix}{message} "
+        if not kwargs:
+            return head + "\n"
+        reserved_bytes = len(head.encode("utf-8")) + 1
+        return head + self._serializer.dumps(kwargs, reserved_bytes) + "\n"
 
     def debug(self, message: str, error: Exception = None, **kwargs) -> None:
         """Write a debug level log message.